@@ -300,9 +300,17 @@ def _run_cmd(
     return stdout
 
 
+_NON_WORD_RUN: t.Final[re.Pattern[str]] = re.compile(r"\W+")
+"""Matches runs of characters that are replaced in a slug."""
+
+
+@functools.lru_cache(maxsize=1024)
 def slugify(source: str) -> str:
     """Convert a source string into a URL-safe slug.
 
+    Results are memoized; the same step and workplan names are slugified
+    repeatedly while a plan is prepared and executed.
+
     Parameters
     ----------
     source : str
@@ -316,14 +324,15 @@ def slugify(source: str) -> str:
     if not source:
         raise ValueError
 
-    return re.sub(r"\W+", "-", source.strip().casefold()).strip("-")
+    return _NON_WORD_RUN.sub("-", source.strip().casefold()).strip("-")
 
 
 def deep_merge(d1: dict[str, t.Any], d2: dict[str, t.Any]) -> dict[str, t.Any]:
     """Deep merge two dictionaries.
 
-    Iterate recursively through keys in dictionary `d2`, replacing
-    any leaf values in `d1` with the value from `d2`.
+    Iterate through nested keys in dictionary `d2`, replacing any leaf
+    values in `d1` with the value from `d2`. Nesting is tracked with an
+    explicit stack, so arbitrarily deep dictionaries can be merged.
 
     NOTE: Currently handles leaf values that are scalar or lists. Additional
     leaf types (such as set) may require additional conditional blocks.
@@ -340,19 +349,28 @@ def deep_merge(d1: dict[str, t.Any], d2: dict[str, t.Any]) -> dict[str, t.Any]:
     dict[str, t.Any]
         The merged dictionaries.
     """
-    for k, v in d2.items():
-        if isinstance(v, dict):
-            d1[k] = deep_merge(d1.get(k, {}), v)
-        elif isinstance(v, list):
-            list_items = []
-            for i, item in enumerate(v):
-                if isinstance(item, dict):
-                    list_items.append(deep_merge(d1.get(k, {})[i], item))
-                else:
-                    list_items.append(item)
-            d1[k] = list_items
-        else:
-            d1[k] = v
+    # pairs of (destination, source) dictionaries that remain to be merged
+    pending = [(d1, d2)]
+
+    while pending:
+        dst, src = pending.pop()
+
+        for k, v in src.items():
+            if isinstance(v, dict):
+                dst[k] = dst.get(k, {})
+                pending.append((dst[k], v))
+            elif isinstance(v, list):
+                list_items = []
+                for i, item in enumerate(v):
+                    if isinstance(item, dict):
+                        list_items.append(dst.get(k, {})[i])
+                        pending.append((list_items[-1], item))
+                    else:
+                        list_items.append(item)
+                dst[k] = list_items
+            else:
+                dst[k] = v
+
     return d1
 
 
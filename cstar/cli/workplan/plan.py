@@ -1,5 +1,7 @@
 import asyncio
+import hashlib
 import typing as t
+from enum import StrEnum, auto
 from pathlib import Path
 
 import typer
@@ -20,6 +22,20 @@ app = typer.Typer()
 
 START_NODE: t.Literal["_cs_start_"] = "_cs_start_"
 TERMINAL_NODE: t.Literal["_cs_term_"] = "_cs_term_"
+CONTROL_NODES: t.Final[frozenset[str]] = frozenset({START_NODE, TERMINAL_NODE})
+"""The marker nodes that are not tasks."""
+VECTOR_NODE_THRESHOLD: t.Final[int] = 50
+"""Graphs with more nodes than this are rendered as SVG by default."""
+
+
+class RenderBackend(StrEnum):
+    """The drawing engines supported by `render`."""
+
+    MATPLOTLIB = auto()
+    """Lay out the graph with networkx and draw it with matplotlib."""
+    GRAPHVIZ = auto()
+    """Lay out and draw the graph with graphviz's hierarchical `dot` engine."""
+
 
 if t.TYPE_CHECKING:
     from networkx import DiGraph
@@ -27,18 +43,22 @@ if t.TYPE_CHECKING:
     from cstar.orchestration.models import Step
 
 
-def _add_marker_nodes(graph: "DiGraph") -> "DiGraph":
+def _add_marker_nodes(graph: "DiGraph", copy: bool = True) -> "DiGraph":
     """Add node to serve as the entrypoint and exit point of the task graph.
     Parameters
     ----------
     graph : DiGraph
         The source graph.
+    copy : bool
+        If `False`, the marker nodes are inserted into the source graph instead
+        of a copy. Use when the caller already owns the graph.
     Returns
     -------
     DiGraph
-        A copy of the original graph with the entrypoint node inserted
+        The graph with the entrypoint node inserted
     """
-    graph = t.cast("DiGraph", graph.copy())
+    if copy:
+        graph = t.cast("DiGraph", graph.copy())
 
     if START_NODE not in graph.nodes:
         graph.add_node(
@@ -59,8 +79,8 @@ def _add_marker_nodes(graph: "DiGraph") -> "DiGraph":
     # find steps with no dependencies, allowing immediate start
     no_dep_edges = [
         (START_NODE, node)
-        for node in graph.nodes()
-        if graph.in_degree(node) == 0 and node not in [START_NODE, TERMINAL_NODE]
+        for node, degree in graph.in_degree()
+        if degree == 0 and node not in CONTROL_NODES
     ]
 
     # Add edges from the  start node to all independent steps
@@ -69,8 +89,8 @@ def _add_marker_nodes(graph: "DiGraph") -> "DiGraph":
     # find steps that have no tasks after them
     terminal_edges = [
         (node, TERMINAL_NODE)
-        for node in graph.nodes()
-        if graph.out_degree(node) == 0 and node != TERMINAL_NODE
+        for node, degree in graph.out_degree()
+        if degree == 0 and node != TERMINAL_NODE
     ]
 
     # Add edges from leaf nodes to the terminal node
@@ -84,15 +104,18 @@ def _initialize_from_graph(
 ) -> tuple["DiGraph", dict[str, "Step"], dict[str, list[str]], dict[str, str]]:
     """Prepare instance from the supplied graph."""
     step_map = {step.name: step for step in workplan.steps}
-    dep_map = {
-        step.name: [s.name for s in workplan.steps if step.name in s.depends_on]
-        for step in workplan.steps
-    }
+    # dependents are the successors already recorded by the planner's graph
+    dep_map = {node: list(successors) for node, successors in graph.adj.items()}
     name_map = {step.name: step.name for step in workplan.steps}
     name_map.update({START_NODE: "start", TERMINAL_NODE: "end"})
 
-    nx.set_node_attributes(graph, "task", "action")
-    graph = _add_marker_nodes(graph)
+    # build a structure-only graph rather than copying the planner's graph
+    # (and its per-node runtime attributes) and then re-tagging every node.
+    render_graph = nx.DiGraph()
+    render_graph.add_nodes_from(graph, action="task")
+    render_graph.add_edges_from(graph.edges)
+
+    graph = _add_marker_nodes(render_graph, copy=False)
     return graph, step_map, dep_map, name_map
 
 
@@ -137,9 +160,105 @@ def _get_color_map(
     tuple[str, ...]
         tuple containing color strings
     """
-    return tuple(
-        group_map[node_data["action"]] for node, node_data in graph.nodes(data=True)
-    )
+    return tuple(group_map[action] for _, action in graph.nodes(data="action"))
+
+
+def _compute_pos(graph: "DiGraph", layout: str) -> dict:
+    """Compute node positions for the graph.
+
+    Parameters
+    ----------
+    graph : DiGraph
+        The graph to lay out
+    layout : str
+        The graph layout to apply
+
+    Returns
+    -------
+    dict
+        A mapping of node names to positions
+    """
+    if layout == "spring":
+        pos = nx.spring_layout(graph)
+    elif layout == "circular":
+        pos = nx.circular_layout(graph)
+    elif layout == "kamada":
+        pos = nx.kamada_kawai_layout(graph)
+    elif layout == "shell":
+        pos = nx.shell_layout(graph)
+    elif layout == "spiral":
+        pos = nx.spiral_layout(graph)
+    elif layout == "planar":
+        pos = nx.planar_layout(graph)
+    elif layout == "fruchterman":
+        pos = nx.fruchterman_reingold_layout(graph)
+    else:
+        # WARNING: bfs_layout appears to require nx >= 3.5
+        pos = nx.bfs_layout(graph, START_NODE)
+
+    return pos
+
+
+def _render_digest(graph: "DiGraph", *options: object) -> str:
+    """Compute a fingerprint of the graph structure and rendering options.
+
+    Parameters
+    ----------
+    graph : DiGraph
+        The graph to be rendered
+    options : object
+        Any rendering options that affect the output image
+
+    Returns
+    -------
+    str
+        A hex digest identifying the rendered image
+    """
+    content = repr((sorted(graph.nodes), sorted(graph.edges), options))
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _render_graphviz(
+    graph: "DiGraph",
+    name_map: dict[str, str],
+    color_map: dict[str, str],
+    write_to: Path,
+    fmt: str,
+) -> None:
+    """Lay out and draw the graph with graphviz's hierarchical `dot` engine.
+
+    Parameters
+    ----------
+    graph : DiGraph
+        The graph to render
+    name_map : dict[str, str]
+        A mapping of node names to display labels
+    color_map : dict[str, str]
+        A mapping of node behavior names to colors
+    write_to : Path
+        The path the image will be written to
+    fmt : str
+        The image format
+
+    Raises
+    ------
+    ValueError
+        If the optional `pygraphviz` dependency is not installed.
+    """
+    try:
+        agraph = nx.nx_agraph.to_agraph(graph)
+    except ImportError as ex:
+        msg = "The graphviz backend requires the optional `pygraphviz` package."
+        raise ValueError(msg) from ex
+
+    agraph.node_attr.update(style="filled", shape="box", fontname="Helvetica-Bold")
+    for node, node_data in graph.nodes(data=True):
+        agraph_node = agraph.get_node(node)
+        agraph_node.attr["label"] = name_map.get(node, node)
+        agraph_node.attr["fillcolor"] = color_map[node_data["action"]]
+
+    agraph.layout(prog="dot")
+    agraph.draw(write_to, format=fmt)
 
 
 async def render(
@@ -147,6 +266,9 @@ async def render(
     image_directory: Path,
     layout: str = "circular",
     cmap: str = "",
+    dpi: int = 150,
+    fmt: t.Literal["png", "svg", ""] = "",
+    backend: RenderBackend = RenderBackend.MATPLOTLIB,
 ) -> Path:
     """Render the graph to a file.
 
@@ -158,16 +280,21 @@ async def render(
         The graph layout to apply
     cmap : str
         A color map to apply to nodes
+    dpi : int
+        The resolution used when rasterizing the image
+    fmt : Literal["png", "svg", ""]
+        The image format. By default, large graphs are written as SVG and all
+        others as PNG.
+    backend : RenderBackend
+        The drawing engine. The `graphviz` backend computes a hierarchical
+        layout natively and bypasses matplotlib; `layout`, `cmap` and `dpi`
+        are ignored when it is used.
 
     Returns
     -------
     Path
         The path to the output file
     """
-    plt.figure(figsize=(11, 8))
-    plt.cla()
-    plt.clf()
-
     graph, *_, name_map = _initialize_from_graph(planner.workplan, planner.graph)
     color_map = _create_color_map()
 
@@ -176,41 +303,49 @@ async def render(
         print(msg)
         return Path("not-found")
 
-    if layout == "spring":
-        pos = nx.spring_layout(graph)
-    elif layout == "circular":
-        pos = nx.circular_layout(graph)
-    elif layout == "kamada":
-        pos = nx.kamada_kawai_layout(graph)
-    elif layout == "shell":
-        pos = nx.shell_layout(graph)
-    elif layout == "spiral":
-        pos = nx.spiral_layout(graph)
-    elif layout == "planar":
-        pos = nx.planar_layout(graph)
-    elif layout == "fruchterman":
-        pos = nx.fruchterman_reingold_layout(graph)
-    else:
-        # WARNING: bfs_layout appears to require nx >= 3.5
-        pos = nx.bfs_layout(graph, START_NODE)
+    if not fmt:
+        fmt = "svg" if len(graph) > VECTOR_NODE_THRESHOLD else "png"
 
-    node_colors = _get_color_map(color_map, graph)
-    nx.draw_networkx(
-        graph,
-        pos,
-        with_labels=True,
-        labels=name_map,
-        node_size=2000,
-        node_color=range(len(graph.nodes)) if cmap else node_colors,
-        font_weight="bold",
-        cmap=cmap if cmap else None,
-    )
+    write_to = image_directory / f"{slugify(planner.workplan.name).lower()}.{fmt}"
 
-    plt.tight_layout(pad=2.0)
+    # skip rendering entirely when the image of an identical plan already exists
+    options = (sorted(name_map.items()), layout, cmap, dpi, fmt, backend)
+    digest = _render_digest(graph, *options)
+    digest_path = write_to.with_name(f"{write_to.name}.hash")
+    if write_to.exists() and digest_path.exists() and digest_path.read_text() == digest:
+        return write_to
 
-    write_to = image_directory / f"{slugify(planner.workplan.name).lower()}.png"
-    plt.savefig(write_to, bbox_inches="tight", dpi=500)  # was "tight"
+    if backend == RenderBackend.GRAPHVIZ:
+        _render_graphviz(graph, name_map, color_map, write_to, fmt)
+        digest_path.write_text(digest)
+        return write_to
 
+    pos = _compute_pos(graph, layout)
+
+    # per-node colors are only needed when no color map is supplied
+    node_colors = range(len(graph)) if cmap else _get_color_map(color_map, graph)
+
+    # defer touching pyplot (and importing matplotlib) until a render is certain
+    fig, ax = plt.subplots(figsize=(11, 8))
+    try:
+        nx.draw_networkx(
+            graph,
+            pos,
+            ax=ax,
+            with_labels=True,
+            labels=name_map,
+            node_size=2000,
+            node_color=node_colors,
+            font_weight="bold",
+            cmap=cmap if cmap else None,
+        )
+
+        fig.tight_layout(pad=2.0)
+        fig.savefig(write_to, bbox_inches="tight", dpi=dpi, format=fmt)
+    finally:
+        plt.close(fig)
+
+    digest_path.write_text(digest)
     return write_to
 
 
@@ -221,15 +356,21 @@ def plan(
         typer.Argument(help="Path to a blueprint file."),
     ],
     output_dir: t.Annotated[
-        Path,
-        typer.Argument(help="Path to a directory where the plan will be stored."),
-    ],
+        Path | None,
+        typer.Argument(
+            help="Path to a directory where the plan will be rendered. When omitted, the execution order is printed and no image is produced."
+        ),
+    ] = None,
     transform: t.Annotated[
         bool,
         typer.Option(
             help="Apply runtime transformations to the workplan before rendering."
         ),
     ] = False,
+    backend: t.Annotated[
+        RenderBackend,
+        typer.Option(help="The drawing engine used to render the plan."),
+    ] = RenderBackend.MATPLOTLIB,
 ) -> None:
     """Review the execution plan generated by a workplan."""
     plan_path: Path | None = None
@@ -246,7 +387,14 @@ def plan(
             workplan = transformer.apply()
 
         planner = Planner(workplan)
-        plan_path = asyncio.run(render(planner, output_dir))
+
+        if output_dir is None:
+            # rendering is opt-in; avoid matplotlib entirely for a text plan
+            for i, step in enumerate(planner.flatten(), start=1):
+                print(f"{i}. {step.name}")
+            return
+
+        plan_path = asyncio.run(render(planner, output_dir, backend=backend))
 
         if plan_path is None:
             raise ValueError("Unable to generate plan")
@@ -299,7 +299,10 @@ class Service(ABC, LoggingMixin):
                         f"No health update in last {hc_elapsed:.2f} seconds."
                     )
 
-                if msg := msg_queue.get_nowait():
+                # block until a message arrives (or the next check is due)
+                # instead of spinning on an empty queue
+                wait = remaining_wait or config.max_health_check_latency
+                if msg := msg_queue.get(timeout=wait):
                     if hc_elapsed >= config.health_check_frequency:
                         self._on_health_check()
                         last_health_check = time.time()
@@ -311,8 +314,6 @@ class Service(ABC, LoggingMixin):
                         )
                     elif command == self.CMD_QUIT:
                         running = False
-                else:
-                    time.sleep(remaining_wait)
 
             except Empty:  # noqa: PERF203
                 ...  # ignore empty queue; just wait for shutdown msg
@@ -273,11 +273,7 @@ class SimulationRunner(Service):
         if self._handler is None:
             return True
 
-        return self._handler.status in [
-            ExecutionStatus.COMPLETED,
-            ExecutionStatus.CANCELLED,
-            ExecutionStatus.FAILED,
-        ]
+        return ExecutionStatus.is_terminal(self._handler.status)
 
     @override
     def _can_shutdown(self) -> bool:
@@ -1,5 +1,6 @@
 import asyncio
 import time
+import typing as t
 from abc import ABC, abstractmethod
 from enum import Enum, auto
 from pathlib import Path
@@ -49,11 +50,13 @@ class ExecutionStatus(Enum):
 
     @classmethod
     def is_terminal(cls, status: "ExecutionStatus") -> bool:
-        return status in [
-            ExecutionStatus.COMPLETED,
-            ExecutionStatus.CANCELLED,
-            ExecutionStatus.FAILED,
-        ]
+        return status in _TERMINAL_EXECUTION_STATUSES
+
+
+_TERMINAL_EXECUTION_STATUSES: t.Final[frozenset[ExecutionStatus]] = frozenset(
+    {ExecutionStatus.COMPLETED, ExecutionStatus.CANCELLED, ExecutionStatus.FAILED}
+)
+"""Statuses of processes that will not change state again."""
 
 
 class ExecutionHandler(ABC, LoggingMixin):
@@ -166,31 +169,22 @@ class ExecutionHandler(ABC, LoggingMixin):
                 self.log.info(msg)
                 return
 
-        if _status == ExecutionStatus.PENDING:
-            start_time = time.time()
-            msg = "This job is still pending. Updates will be available after it starts running."
-            while seconds == 0 or (time.time() - start_time < seconds):
-                self.log.info(msg)
-                time.sleep(STATUS_RECHECK_SECONDS)
-                _status = self.status
-                if _status != ExecutionStatus.PENDING:
-                    msg = f"Job status is now {_status}"
-                    self.log.info(msg)
-                    break
-
         try:
             with open(self.output_file) as f:
                 f.seek(0, 2)  # Move to the end of the file
                 start_time = time.time()
                 while seconds == 0 or (time.time() - start_time < seconds):
-                    if self.output_file.exists():
-                        line = f.readline()
+                    # drain everything written since the last pass so a single
+                    # (possibly scheduler-backed) status query covers the batch
+                    lines = f.readlines() if self.output_file.exists() else []
 
                     if self.status != ExecutionStatus.RUNNING:
                         return
-                    elif line:
+
+                    for line in lines:
                         self.log.info(line.rstrip())
-                    else:
+
+                    if not lines:
                         await asyncio.sleep(0.1)  # 100ms delay between updates
         except KeyboardInterrupt:
             self.log.info("Live status updates stopped by user.")
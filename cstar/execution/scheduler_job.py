@@ -21,6 +21,28 @@ from cstar.system.scheduler import (
 if t.TYPE_CHECKING:
     from cstar.system.scheduler import Queue, Scheduler
 
+_SACCT_STATUS_MAP: t.Final[dict[str, ExecutionStatus]] = {
+    "PENDING": ExecutionStatus.PENDING,
+    "RUNNING": ExecutionStatus.RUNNING,
+    "COMPLETED": ExecutionStatus.COMPLETED,
+    "CANCELLED": ExecutionStatus.CANCELLED,
+    "FAILED": ExecutionStatus.FAILED,
+    "TIMEOUT": ExecutionStatus.FAILED,
+    "OUT_OF_MEMORY": ExecutionStatus.FAILED,
+    "NODE_FAIL": ExecutionStatus.FAILED,
+    "PREEMPTED": ExecutionStatus.FAILED,
+    "BOOT_FAIL": ExecutionStatus.FAILED,
+    "DEADLINE": ExecutionStatus.FAILED,
+    "COMPLETING": ExecutionStatus.ENDING,
+    "REQUEUED": ExecutionStatus.PENDING,
+    "SUSPENDED": ExecutionStatus.HELD,
+}
+"""Map sacct states to ExecutionStatus enum.
+
+The primary states are listed first; the single-job query scans for them in
+order across all job steps.
+"""
+
 
 def get_status_of_slurm_job(job_id: str) -> ExecutionStatus:
     """Check the status of a Slurm job using sacct.
@@ -39,15 +61,7 @@ def get_status_of_slurm_job(job_id: str) -> ExecutionStatus:
     msg_err = f"Failed to retrieve job status using {sacct_cmd}."
     stdout = _run_cmd(sacct_cmd, msg_err=msg_err, raise_on_error=True)
 
-    # Map sacct states to ExecutionStatus enum
-    sacct_status_map = {
-        "PENDING": ExecutionStatus.PENDING,
-        "RUNNING": ExecutionStatus.RUNNING,
-        "COMPLETED": ExecutionStatus.COMPLETED,
-        "CANCELLED": ExecutionStatus.CANCELLED,
-        "FAILED": ExecutionStatus.FAILED,
-    }
-    for state, status in sacct_status_map.items():
+    for state, status in _SACCT_STATUS_MAP.items():
         if state in stdout:
             return status
 
@@ -55,6 +69,42 @@ def get_status_of_slurm_job(job_id: str) -> ExecutionStatus:
     return ExecutionStatus.UNKNOWN
 
 
+def get_status_of_slurm_jobs(job_ids: Iterable[str]) -> dict[str, ExecutionStatus]:
+    """Check the status of several Slurm jobs with a single sacct query.
+
+    Parameters
+    ----------
+    job_ids: Iterable[str]
+        The job_ids to check
+
+    Returns
+    -------
+    statuses: dict[str, ExecutionStatus]
+        The status of each job, keyed by job_id. Jobs missing from the sacct
+        output are reported as `ExecutionStatus.UNKNOWN`.
+    """
+    statuses = dict.fromkeys(job_ids, ExecutionStatus.UNKNOWN)
+    if not statuses:
+        return statuses
+
+    # -X limits output to the job allocation (no batch/extern step rows)
+    sacct_cmd = (
+        f"sacct -X -j {','.join(statuses)} "
+        "--format=JobIDRaw,State --noheader --parsable2"
+    )
+    msg_err = f"Failed to retrieve job status using {sacct_cmd}."
+    stdout = _run_cmd(sacct_cmd, msg_err=msg_err, raise_on_error=True)
+
+    for line in stdout.splitlines():
+        job_id, _, state = line.strip().partition("|")
+        if job_id in statuses:
+            # states may carry a suffix, e.g. `CANCELLED by 1234`
+            state = state.split(" ", 1)[0].rstrip("+")
+            statuses[job_id] = _SACCT_STATUS_MAP.get(state, ExecutionStatus.UNKNOWN)
+
+    return statuses
+
+
 def create_scheduler_job(
     commands: str,
     account_key: str,
@@ -1,5 +1,6 @@
 import os
 import random
+import shlex
 import sys
 import textwrap
 import typing as t
@@ -47,7 +48,10 @@ def convert_roms_step_to_command(step: "Step") -> str:
         The complete CLI command.
     """
     worker_module = "cstar.entrypoint.worker.worker"
-    return f"{sys.executable} -m {worker_module}  -b {step.blueprint_path}"
+    # quote each argument so paths containing spaces survive re-tokenization
+    return shlex.join(
+        [sys.executable, "-m", worker_module, "-b", str(step.blueprint_path)]
+    )
 
 
 def convert_step_to_placeholder(step: "Step") -> str:
@@ -97,11 +101,16 @@ def register_command_mapping(
 
 
 def get_command_mapping(
-    application: Application,
+    application: Application | str,
     launcher: type["Launcher"],
 ) -> StepToCommandConversionFn:
     launcher_map = launcher_aware_app_to_cmd_map[launcher]
-    step_converter = launcher_map[application.value]
+
+    # `Application` is a `StrEnum`, so raw step values index the map directly
+    # without constructing (and validating) an enum member per lookup.
+    if (step_converter := launcher_map.get(application)) is None:
+        msg = f"No command mapping is registered for application `{application}`"
+        raise ValueError(msg)
 
     if converter_override := os.getenv(ENV_CSTAR_CMD_CONVERTER_OVERRIDE, ""):
         if converter_override not in launcher_map:
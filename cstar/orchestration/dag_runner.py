@@ -1,14 +1,14 @@
 import asyncio
 import os
+import random
 import typing as t
 from dataclasses import dataclass
-from itertools import cycle
+from itertools import chain, repeat
 from pathlib import Path
 
 from cstar.base.log import get_logger
 from cstar.execution.file_system import DirectoryManager
 from cstar.orchestration.launch.local import LocalLauncher
-from cstar.orchestration.launch.slurm import SlurmLauncher
 from cstar.orchestration.models import Workplan
 from cstar.orchestration.orchestration import (
     Orchestrator,
@@ -40,7 +40,10 @@ class DagStatus:
 
 
 def incremental_delays() -> t.Generator[float, None, None]:
-    """Return a value from an infinite cycle of incremental delays.
+    """Return a value from an infinite series of incremental delays.
+
+    The series increases through the configured delays and then remains at
+    the final (longest) delay until it is restarted.
 
     Returns
     -------
@@ -54,8 +57,7 @@ def incremental_delays() -> t.Generator[float, None, None]:
         except ValueError:
             log.warning(f"Malformed delay provided: {custom_delays}. Using defaults.")
 
-    delay_cycle = cycle(delays)
-    yield from delay_cycle
+    yield from chain(delays, repeat(delays[-1]))
 
 
 async def retrieve_run_progress(orchestrator: Orchestrator) -> DagStatus:
@@ -108,6 +110,9 @@ async def load_dag_status(path: Path, run_id: str) -> DagStatus:
 
     configure_environment(run_id=run_id)
 
+    # the SLURM launcher depends on prefect; only import it when it is used
+    from cstar.orchestration.launch.slurm import SlurmLauncher
+
     planner = Planner(workplan=wp)
     launcher = SlurmLauncher()
     orchestrator = Orchestrator(planner, launcher)
@@ -138,14 +143,21 @@ async def process_plan(orchestrator: Orchestrator, mode: RunMode) -> None:
         curr_closed = orchestrator.get_closed_nodes(mode=mode)
         curr_open = orchestrator.get_open_nodes(mode=mode)
 
-        if curr_closed != closed_set or curr_open != curr_open:
+        if curr_closed != closed_set or curr_open != open_set:
             # reset to initial delay when a task is found or completed
             delay_iter = iter(incremental_delays())
 
         open_set = curr_open
         closed_set = curr_closed
 
-        sleep_duration = next(delay_iter)
+        if open_set is None:
+            # don't wait for another poll once the plan is complete
+            break
+
+        # jitter the delay so concurrent workplans don't poll the scheduler
+        # in lock-step once they settle on the same backoff step
+        delay = next(delay_iter)
+        sleep_duration = random.uniform(delay / 2, delay)
         await asyncio.sleep(sleep_duration)
 
     log.info(f"Workplan {mode} is complete.")
@@ -220,6 +232,8 @@ async def build_and_run_dag(
 
     launcher: Launcher | None = None
     if cstar_sysmgr.scheduler:
+        from cstar.orchestration.launch.slurm import SlurmLauncher
+
         launcher = SlurmLauncher()
     else:
         launcher = LocalLauncher()
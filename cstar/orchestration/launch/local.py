@@ -1,16 +1,16 @@
 import asyncio
 import datetime
+import os
+import shlex
+import signal
 import typing as t
 from multiprocessing import Process as MpProcess
+from subprocess import DEVNULL
 from subprocess import run as sprun
 
-from psutil import NoSuchProcess
-from psutil import Process as PsProcess
-
 from cstar.base.exceptions import CstarExpectationFailed
 from cstar.base.utils import slugify
 from cstar.orchestration.converter.converter import get_command_mapping
-from cstar.orchestration.models import Application
 from cstar.orchestration.orchestration import Launcher, ProcessHandle, Status, Task
 
 if t.TYPE_CHECKING:
@@ -19,7 +19,9 @@ if t.TYPE_CHECKING:
 
 
 def run_as_process(step: "Step", cmd: list[str]) -> dict[str, int]:
-    p = sprun(args=cmd, text=True, check=False)
+    # lead a new process group so the whole tree can be signalled at once
+    os.setsid()
+    p = sprun(args=cmd, text=True, check=False, stdin=DEVNULL)
     return {step.name: p.returncode}
 
 
@@ -31,6 +33,9 @@ class LocalHandle(ProcessHandle):
     start_at: float
     """The process creation time as a posix timestamp (in seconds)."""
 
+    REAP_INTERVAL: t.ClassVar[float] = 0.01
+    """Seconds between checks for the exit code of a process that has exited."""
+
     def __init__(
         self,
         step: "Step",
@@ -53,12 +58,53 @@ class LocalHandle(ProcessHandle):
 
         self.step = step
         self.process = process
+        self._exited: asyncio.Future[None] | None = None
         self.start_at = (
             start_at.timestamp()
             if isinstance(start_at, datetime.datetime)
             else start_at
         )
 
+    async def wait_exit(self) -> None:
+        """Wait for the process to exit without polling.
+
+        The process sentinel becomes readable when the process terminates, so
+        the waiter is woken by the event loop on exit instead of on a timer.
+        The exit code of the process is available once this returns.
+        """
+        if self.process.exitcode is not None:
+            return
+
+        loop = asyncio.get_running_loop()
+        sentinel = self.process.sentinel
+
+        # share one waiter per handle; a second reader on the fd would replace
+        # the first and leave its waiter blocked forever.
+        if self._exited is None or self._exited.get_loop() is not loop:
+            exited = loop.create_future()
+
+            def _on_exit() -> None:
+                loop.remove_reader(sentinel)
+                if not exited.done():
+                    exited.set_result(None)
+
+            try:
+                loop.add_reader(sentinel, _on_exit)
+            except NotImplementedError:
+                # event loops without fd readiness support fall back to polling
+                while self.process.exitcode is None:
+                    await asyncio.sleep(1)
+                return
+
+            self._exited = exited
+
+        await asyncio.shield(self._exited)
+
+        # the sentinel closes as the process exits, which may be moments
+        # before it can be reaped; wait until the exit code is populated.
+        while self.process.exitcode is None:
+            await asyncio.sleep(self.REAP_INTERVAL)
+
     @property
     def elapsed(self) -> float:
         """The number of seconds passed since the task was started.
@@ -74,6 +120,66 @@ class LocalHandle(ProcessHandle):
 class LocalLauncher(Launcher[LocalHandle]):
     """A launcher that executes steps in a local process."""
 
+    TERMINATE_GRACE: t.ClassVar[float] = 2.0
+    """Seconds a cancelled process may take to exit before it is killed."""
+
+    @staticmethod
+    def _signal(process: MpProcess, sig: signal.Signals) -> None:
+        """Send a signal to a process and every process in its group.
+
+        Parameters
+        ----------
+        process : MpProcess
+            The process leading the group to signal.
+        sig : signal.Signals
+            The signal to send.
+        """
+        try:
+            # the process leads its own group; signal its children with it
+            os.killpg(t.cast("int", process.pid), sig)
+        except (ProcessLookupError, PermissionError):
+            if sig == signal.SIGKILL:
+                process.kill()
+            else:
+                process.terminate()
+
+    @staticmethod
+    def _group_alive(process: MpProcess) -> bool:
+        """Determine if any process remains in the group led by a process.
+
+        Parameters
+        ----------
+        process : MpProcess
+            The process leading the group.
+
+        Returns
+        -------
+        bool
+            `True` if at least one member of the group still exists.
+        """
+        try:
+            os.killpg(t.cast("int", process.pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    @staticmethod
+    async def _wait_group_exit(handle: LocalHandle) -> None:
+        """Wait for a process and every other member of its group to exit.
+
+        Parameters
+        ----------
+        handle : LocalHandle
+            The handle of the process leading the group.
+        """
+        await handle.wait_exit()
+
+        # children that ignore or outlive the signal keep the group alive
+        while LocalLauncher._group_alive(handle.process):
+            await asyncio.sleep(handle.REAP_INTERVAL)
+
     @staticmethod
     async def _submit(step: "Step", dependencies: list[LocalHandle]) -> LocalHandle:
         """Submit a step to SLURM as a new batch allocation.
@@ -91,7 +197,7 @@ class LocalLauncher(Launcher[LocalHandle]):
             A ProcessHandle identifying the newly submitted job.
         """
         step_converter = get_command_mapping(
-            Application(step.application),
+            step.application,
             LocalLauncher,
         )
         cmd = step_converter(step)
@@ -100,24 +206,18 @@ class LocalLauncher(Launcher[LocalHandle]):
             mp_process = MpProcess(
                 target=run_as_process,
                 name=slugify(step.name),
-                args=(step, cmd.split()),
+                args=(step, shlex.split(cmd)),
                 daemon=True,
             )
             mp_process.start()
+
+            # the time observed immediately after the fork is accurate enough for
+            # `elapsed` and avoids parsing `/proc` for the exact creation time.
             create_time = datetime.datetime.now(tz=datetime.timezone.utc)
 
             if pid := mp_process.pid:
                 print(f"Local run of `{step.application}` created pid: {pid}")
 
-                try:
-                    ps_process = PsProcess(pid)
-                    create_timestamp = ps_process.create_time()
-                    create_time = datetime.datetime.fromtimestamp(
-                        create_timestamp, tz=datetime.timezone.utc
-                    )
-                except NoSuchProcess:
-                    print(f"Unable to retrieve exact start time for pid: {pid}")
-
                 return LocalHandle(
                     step,
                     mp_process,
@@ -176,23 +276,25 @@ class LocalLauncher(Launcher[LocalHandle]):
         Task[LocalHandle]
             A Task containing information about the newly submitted job.
         """
-        tasks = [asyncio.Task(cls.query_status(h.step, h)) for h in dependencies]
-        statuses = await asyncio.gather(*tasks)
-        active_found = any(map(Status.is_running, statuses))
-        failure_found = any(map(Status.is_failure, statuses))
-
-        # wait for the dependencies to complete before launching
-        while active_found and not failure_found:
-            await asyncio.sleep(1)
+        waiters = {asyncio.Task(h.wait_exit()): h for h in dependencies}
+        pending = set(waiters)
 
-            tasks = [asyncio.Task(cls.query_status(h.step, h)) for h in dependencies]
-            statuses = await asyncio.gather(*tasks)
-            active_found = any(map(Status.is_running, statuses))
-            failure_found = any(map(Status.is_failure, statuses))
+        # wake as each dependency exits; stop early if any of them failed
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for waiter in done:
+                    handle = waiters[waiter]
+                    status = await cls.query_status(handle.step, handle)
 
-        if failure_found:
-            msg = f"Dependency of step {step.name} failed. Unable to continue."
-            raise CstarExpectationFailed(msg)
+                    if Status.is_failure(status):
+                        msg = f"Dependency of step {step.name} failed. Unable to continue."
+                        raise CstarExpectationFailed(msg)
+        finally:
+            for waiter in pending:
+                waiter.cancel()
 
         handle = await LocalLauncher._submit(step, dependencies)
         return Task(
@@ -253,7 +355,21 @@ class LocalLauncher(Launcher[LocalHandle]):
                 # can't cancel a completed process
                 print(f"Unable to cancel a completed task `{process.pid}")
             else:
-                process.kill()
+                # ask politely first so the step can flush logs and release
+                # resources; escalate only if it outlives the grace period.
+                LocalLauncher._signal(process, signal.SIGTERM)
                 item.status = Status.Cancelled
 
+                try:
+                    await asyncio.wait_for(
+                        cls._wait_group_exit(item.handle), timeout=cls.TERMINATE_GRACE
+                    )
+                except TimeoutError:
+                    LocalLauncher._signal(process, signal.SIGKILL)
+                    try:
+                        await asyncio.wait_for(item.handle.wait_exit(), timeout=1)
+                    except TimeoutError:
+                        msg = f"Process `{process.pid}` did not exit after cancellation"
+                        print(msg)
+
         return item
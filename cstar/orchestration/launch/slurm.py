@@ -1,3 +1,4 @@
+import asyncio
 import os
 import typing as t
 
@@ -9,10 +10,10 @@ from cstar.base.utils import _run_cmd
 from cstar.execution.handler import ExecutionStatus
 from cstar.execution.scheduler_job import (
     create_scheduler_job,
-    get_status_of_slurm_job,
+    get_status_of_slurm_jobs,
 )
 from cstar.orchestration.converter.converter import get_command_mapping
-from cstar.orchestration.models import Application, RomsMarblBlueprint
+from cstar.orchestration.models import RomsMarblBlueprint
 from cstar.orchestration.orchestration import (
     Launcher,
     ProcessHandle,
@@ -34,6 +35,17 @@ if t.TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+_EXECUTION_STATUS_MAP: t.Final[dict[ExecutionStatus, Status]] = {
+    ExecutionStatus.PENDING: Status.Running,
+    ExecutionStatus.RUNNING: Status.Running,
+    ExecutionStatus.ENDING: Status.Running,
+    ExecutionStatus.HELD: Status.Running,
+    ExecutionStatus.COMPLETED: Status.Done,
+    ExecutionStatus.CANCELLED: Status.Cancelled,
+    ExecutionStatus.FAILED: Status.Failed,
+}
+"""Map SLURM job states to task statuses; other states are `Unsubmitted`."""
+
 
 def cache_key_func(context: "TaskRunContext", params: dict[str, t.Any]) -> str:
     """Cache on a combination of the task name and user-assigned run id.
@@ -80,6 +92,12 @@ class SlurmHandle(ProcessHandle):
 class SlurmLauncher(Launcher[SlurmHandle]):
     """A launcher that executes steps in a SLURM-enabled cluster."""
 
+    _status_batch: t.ClassVar[asyncio.Task[dict[str, ExecutionStatus]] | None] = None
+    """The in-flight status query shared by concurrent status requests."""
+
+    _status_batch_ids: t.ClassVar[set[str]] = set()
+    """The job IDs that will be included in the next status query."""
+
     @staticmethod
     def configured_queue() -> str:
         """Get the queue to use for SLURM jobs.
@@ -137,11 +155,13 @@ class SlurmLauncher(Launcher[SlurmHandle]):
             A ProcessHandle identifying the newly submitted job.
         """
         job_name = step.safe_name
-        bp = deserialize(step.blueprint_path, RomsMarblBlueprint)
+        bp = await asyncio.to_thread(
+            deserialize, step.blueprint_path, RomsMarblBlueprint
+        )
         job_dep_ids = [d.pid for d in dependencies]
 
         step_converter = get_command_mapping(
-            Application(step.application),
+            step.application,
             SlurmLauncher,
         )
 
@@ -171,11 +191,15 @@ class SlurmLauncher(Launcher[SlurmHandle]):
             depends_on=job_dep_ids,
         )
 
-        short_command = command.replace("\n", "")[:40]  # shorten and omit newlines
+        log.debug(
+            "Submitting command `%s...` for step `%s`.",
+            command.replace("\n", "")[:40],  # shorten and omit newlines
+            step.name,
+        )
 
-        msg = f"Submitting command `{short_command}...` for step `{step.name}`."
-        log.debug(msg)
-        job.submit()
+        # run the blocking `sbatch` call off the event loop so that concurrent
+        # launches from the orchestrator overlap instead of serializing.
+        await asyncio.to_thread(job.submit)
 
         if job.id:
             log.debug("Submission of `%s` created Job ID `%s`", step.name, job.id)
@@ -184,6 +208,29 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         msg = f"Unable to retrieve job ID for step `{step.name}`. Job `{job}` failed"
         raise RuntimeError(msg)
 
+    @staticmethod
+    async def _query_status_batch() -> dict[str, ExecutionStatus]:
+        """Retrieve the status of every job requested during the current tick.
+
+        Status requests made concurrently (e.g. by the orchestrator gathering
+        all open nodes) are coalesced into a single `sacct` invocation.
+
+        Returns
+        -------
+        dict[str, ExecutionStatus]
+            The status of each requested job, keyed by job ID.
+        """
+        # yield once so all concurrent requesters can join this batch
+        await asyncio.sleep(0)
+
+        job_ids = SlurmLauncher._status_batch_ids
+        SlurmLauncher._status_batch_ids = set()
+        SlurmLauncher._status_batch = None
+
+        log.debug("Querying status of %d SLURM jobs", len(job_ids))
+        # sacct may take a while to respond; don't block the event loop on it
+        return await asyncio.to_thread(get_status_of_slurm_jobs, sorted(job_ids))
+
     @staticmethod
     async def _status(step: "Step", handle: SlurmHandle) -> ExecutionStatus:
         """Retrieve the status of a step running in SLURM.
@@ -200,10 +247,17 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         ExecutionStatus
             The current status of the step.
         """
-        status = get_status_of_slurm_job(handle.pid)
+        SlurmLauncher._status_batch_ids.add(handle.pid)
 
-        msg = f"Status of job {handle.pid} is {status} for step {step.name}"
-        log.debug(msg)
+        if SlurmLauncher._status_batch is None:
+            SlurmLauncher._status_batch = asyncio.ensure_future(
+                SlurmLauncher._query_status_batch()
+            )
+
+        statuses = await asyncio.shield(SlurmLauncher._status_batch)
+        status = statuses[handle.pid]
+
+        log.debug("Status of job %s is %s for step %s", handle.pid, status, step.name)
 
         return status
 
@@ -255,24 +309,9 @@ class SlurmLauncher(Launcher[SlurmHandle]):
         handle = item.handle if isinstance(item, Task) else item
         exec_status = await SlurmLauncher._status(step, handle)
 
-        msg = f"SLURM job `{handle.pid}` status is `{exec_status}`"
-        log.debug(msg)
-
-        if exec_status in [
-            ExecutionStatus.PENDING,
-            ExecutionStatus.RUNNING,
-            ExecutionStatus.ENDING,
-            ExecutionStatus.HELD,
-        ]:
-            return Status.Running
-        if exec_status == ExecutionStatus.COMPLETED:
-            return Status.Done
-        if exec_status == ExecutionStatus.CANCELLED:
-            return Status.Cancelled
-        if exec_status == ExecutionStatus.FAILED:
-            return Status.Failed
-
-        return Status.Unsubmitted
+        log.debug("SLURM job `%s` status is `%s`", handle.pid, exec_status)
+
+        return _EXECUTION_STATUS_MAP.get(exec_status, Status.Unsubmitted)
 
     @classmethod
     async def cancel(cls, item: Task[SlurmHandle]) -> Task[SlurmHandle]:
@@ -83,7 +83,7 @@ class Status(IntEnum):
         -------
         bool
         """
-        return status in {Status.Done, Status.Cancelled, Status.Failed}
+        return status in _TERMINAL_STATUSES
 
     @classmethod
     def is_failure(cls, status: "Status") -> bool:
@@ -98,7 +98,7 @@ class Status(IntEnum):
         -------
         bool
         """
-        return status in {Status.Cancelled, Status.Failed}
+        return status in _FAILURE_STATUSES
 
     @classmethod
     def is_running(cls, status: "Status") -> bool:
@@ -113,9 +113,30 @@ class Status(IntEnum):
         -------
         bool
         """
-        return status in {Status.Submitted, Status.Running, Status.Ending}
+        return status in _RUNNING_STATUSES
 
 
+_TERMINAL_STATUSES: t.Final[frozenset[Status]] = frozenset(
+    {Status.Done, Status.Cancelled, Status.Failed}
+)
+"""Statuses of tasks that will not change state again."""
+
+_FAILURE_STATUSES: t.Final[frozenset[Status]] = frozenset(
+    {Status.Cancelled, Status.Failed}
+)
+"""Statuses of tasks that terminated without completing."""
+
+_RUNNING_STATUSES: t.Final[frozenset[Status]] = frozenset(
+    {Status.Submitted, Status.Running, Status.Ending}
+)
+"""Statuses of tasks that are in progress."""
+
+_SCHEDULED_STATUSES: t.Final[frozenset[Status]] = _TERMINAL_STATUSES | {
+    Status.Submitted,
+    Status.Running,
+}
+"""Statuses of tasks that no longer require scheduling."""
+
 _THandle = t.TypeVar("_THandle", bound=ProcessHandle)
 
 
@@ -168,6 +189,8 @@ class LiveStep(Step):
 class Task(t.Generic[_THandle]):
     """A task represents a live-execution of a step."""
 
+    __slots__ = ("handle", "status", "step")
+
     status: Status
     """Current task status."""
 
@@ -208,6 +231,12 @@ class Planner(LoggingMixin):
     graph: "DiGraph"
     """The graph used for task planning."""
 
+    _plan: list[Step] | None
+    """The cached traversal of the execution plan."""
+
+    _status_index: dict[Status, set[str]]
+    """The nodes currently holding each status."""
+
     def __init__(
         self,
         workplan: Workplan,
@@ -221,6 +250,11 @@ class Planner(LoggingMixin):
         """
         self.workplan = workplan
         self.graph = Planner._workplan_to_graph(workplan)
+        self._plan = None
+
+        self._status_index = {status: set() for status in Status}
+        for n, status in self.graph.nodes(data=KEY_STATUS):
+            self._status_index[status].add(n)
 
     @classmethod
     def _workplan_to_graph(cls, workplan: Workplan) -> "DiGraph":
@@ -236,17 +270,17 @@ class Planner(LoggingMixin):
         DiGraph
             A graph of the execution plan.
         """
-        data: t.Mapping[str, list[str]] = {s.name: [] for s in workplan.steps}
-        for step in workplan.steps:
-            for prereq in step.depends_on:
-                data[prereq].append(step.name)
-
-        g = nx.DiGraph(data)
-        defaults = {
-            n.name: {KEY_STATUS: Status.Unsubmitted, KEY_STEP: n, KEY_TASK: None}
-            for n in workplan.steps
-        }
-        nx.set_node_attributes(g, values=defaults)
+        g = nx.DiGraph()
+
+        # attach default attributes as nodes are inserted to avoid building an
+        # intermediate adjacency mapping and a second attribute-setting pass.
+        g.add_nodes_from(
+            (s.name, {KEY_STATUS: Status.Unsubmitted, KEY_STEP: s, KEY_TASK: None})
+            for s in workplan.steps
+        )
+        g.add_edges_from(
+            (prereq, s.name) for s in workplan.steps for prereq in s.depends_on
+        )
         return g
 
     def flatten(self) -> t.Iterable[Step]:
@@ -257,14 +291,17 @@ class Planner(LoggingMixin):
         Iterable[Step]
             A traversal of the execution plan honoring all dependencies.
         """
+        if self._plan is None:
+            nodes = self.graph.nodes
 
-        def f(step: Step) -> bool:
-            """Filter steps that are non-null."""
-            return step is not None
+            # single O(V+E) pass over Kahn's ordering; skips nodes without a step
+            self._plan = [
+                step
+                for k in nx.topological_sort(self.graph)
+                if (step := nodes[k].get(KEY_STEP)) is not None
+            ]
 
-        keys = nx.topological_sort(self.graph)
-        steps = self.retrieve_all(KEY_STEP, filter_fn=f)
-        return [steps[k] for k in keys]
+        return list(self._plan)
 
     @t.overload
     def store(self, n: str, key: t.Literal["status"], value: Status) -> None: ...
@@ -292,8 +329,32 @@ class Planner(LoggingMixin):
             msg = f"Updating reserved key `{key}` on node `{n}` with value `{value}`"
             self.log.debug(msg)
 
+        if key == KEY_STEP:
+            # a replaced step invalidates the cached traversal
+            self._plan = None
+        elif key == KEY_STATUS:
+            # keep the status index in step so lookups avoid a full node scan
+            if stored in self._status_index:
+                self._status_index[stored].discard(n)
+            self._status_index[t.cast("Status", value)].add(n)
+
         self.graph.nodes[n][key] = value
 
+    def nodes_with_status(self, statuses: t.Iterable[Status]) -> set[str]:
+        """Retrieve the nodes currently holding any of the given statuses.
+
+        Parameters
+        ----------
+        statuses : Iterable[Status]
+            The statuses to match.
+
+        Returns
+        -------
+        set[str]
+            The identifiers of all matching nodes.
+        """
+        return set().union(*(self._status_index[s] for s in statuses))
+
     @t.overload
     def retrieve(
         self,
@@ -490,36 +551,33 @@ class Orchestrator(LoggingMixin):
         """
         g = self.planner.graph
         open_nodes: list[str] = []
-        closed_set = self.get_closed_nodes(mode=mode)
-
-        if self.planner.workplan:
-            nodes = {s.name for s in self.planner.workplan.steps}
-        else:
-            nodes = {n for n in self.planner.graph}
+        targets = (
+            _SCHEDULED_STATUSES if mode == RunMode.Schedule else _TERMINAL_STATUSES
+        )
 
-        working_list = set(nodes).difference(closed_set)
+        # only nodes that are not yet closed are visited; completed nodes
+        # accumulate in the planner's status index without being rescanned.
+        working_list = self.planner.nodes_with_status(
+            s for s in Status if s not in targets
+        )
 
         if failures := {
             u: g.nodes[u][KEY_STATUS]
-            for u in closed_set
-            if Status.is_failure(g.nodes[u][KEY_STATUS])
+            for u in self.planner.nodes_with_status(_FAILURE_STATUSES)
         }:
-            self.log.error(f"Exiting due to task failures: {failures}")
+            self.log.error("Exiting due to task failures: %s", failures)
             return None
 
-        for n in working_list:
-            in_edges = list(g.in_edges(n))
-            in_degree = g.in_degree(n)
-
-            satisfied = all(
-                Status.is_running(g.nodes[u][KEY_STATUS])
-                or Status.is_terminal(g.nodes[u][KEY_STATUS])
-                if mode == RunMode.Schedule
-                else Status.is_terminal(g.nodes[u][KEY_STATUS])
-                for (u, _) in in_edges
-            )
+        satisfying = (
+            _RUNNING_STATUSES | _TERMINAL_STATUSES
+            if mode == RunMode.Schedule
+            else _TERMINAL_STATUSES
+        )
 
-            if in_degree == 0 or satisfied:
+        for n in working_list:
+            # read predecessors from the adjacency store directly; a node with
+            # no predecessors is trivially satisfied.
+            if all(g.nodes[u][KEY_STATUS] in satisfying for u in g.pred[n]):
                 open_nodes.append(n)
 
         if working_list:
@@ -536,15 +594,12 @@ class Orchestrator(LoggingMixin):
         set of str
             A set of node IDs identifying nodes with a Done status.
         """
-        targets = {Status.Done, Status.Cancelled, Status.Failed}
-
-        if mode == RunMode.Schedule:
-            targets.update({Status.Submitted, Status.Running})
-
-        return set(
-            self.planner.retrieve_all(KEY_STATUS, filter_fn=lambda x: x in targets)
+        targets = (
+            _SCHEDULED_STATUSES if mode == RunMode.Schedule else _TERMINAL_STATUSES
         )
 
+        return self.planner.nodes_with_status(targets)
+
     def _locate_dependencies(self, step: LiveStep) -> list[ProcessHandle] | None:
         """Look for the dependencies of the step.
 
@@ -602,7 +657,7 @@ class Orchestrator(LoggingMixin):
         else:
             task = await self.launcher.launch(step, dependencies)
             self.planner.store(node, KEY_TASK, task)
-            self.log.info(f"Launched step: {step.name}")
+            self.log.info("Launched step: %s", step.name)
 
         self.planner.store(node, KEY_STATUS, task.status)
         return task
@@ -622,10 +677,10 @@ class Orchestrator(LoggingMixin):
             return
 
         if task.status == Status.Done:
-            self.log.info(f"Closed node: {n}")
+            self.log.info("Closed node: %s", n)
             self.planner.store(n, KEY_STATUS, Status.Done)
         elif task.status == Status.Failed:
-            self.log.warning(f"Failed node: {n}")
+            self.log.warning("Failed node: %s", n)
             # TODO: on failure, cancel all jobs if anything depends on it
             # - NOTE: this may occur naturally with SLURM but not local launch
             self.planner.store(n, KEY_STATUS, Status.Failed)
@@ -1,13 +1,20 @@
 import enum
+import functools
+import os
 import typing as t
 from pathlib import Path, PosixPath
 
 import yaml
-from pydantic import BaseModel
-from yaml import safe_load
+from pydantic import BaseModel, ValidationError
 
 from cstar.orchestration import models
 
+try:
+    # prefer the libyaml-backed loader; it parses large workplans much faster
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 
 class PersistenceMode(enum.StrEnum):
     """Supported serialization engines."""
@@ -34,8 +41,8 @@ def _read_json(path: Path, klass: type[_T]) -> _T:
     -------
     _T
     """
-    with path.open("r", encoding="utf-8") as fp:
-        return klass.model_validate_json(json_data=fp.read())
+    # pydantic parses bytes directly; skip decoding into an intermediate str
+    return klass.model_validate_json(json_data=path.read_bytes())
 
 
 def _read_yaml(path: Path, klass: type[_T]) -> _T:
@@ -52,9 +59,18 @@ def _read_yaml(path: Path, klass: type[_T]) -> _T:
     -------
     _T
     """
-    with path.open("r", encoding="utf-8") as fp:
-        model_dict = safe_load(fp)
-        return klass.model_validate(model_dict)
+    content = path.read_bytes()
+
+    if content.lstrip()[:1] in {b"{", b"["}:
+        # JSON is valid YAML; try pydantic's native JSON parser before PyYAML
+        try:
+            return klass.model_validate_json(content)
+        except ValidationError as ex:
+            if not any(err["type"] == "json_invalid" for err in ex.errors()):
+                raise
+
+    model_dict = yaml.load(content, Loader=SafeLoader)
+    return klass.model_validate(model_dict)
 
 
 def model_to_yaml(model: BaseModel) -> str:
@@ -127,6 +143,43 @@ def _mode_detect(path: Path) -> PersistenceMode:
     return PersistenceMode.yaml
 
 
+@functools.lru_cache(maxsize=128)
+def _read_cached(
+    path: Path,
+    klass: type[_T],
+    mode: PersistenceMode,
+    mtime_ns: int,
+    size: int,
+    cwd: str,
+) -> _T:
+    """Read and validate a file, memoizing the result.
+
+    Parameters
+    ----------
+    path : Path
+        The absolute path to a file containing content.
+    klass : type[_T]
+        The type to instantiate from the content.
+    mode : PersistenceMode
+        The serializer used to create the file.
+    mtime_ns : int
+        The modification time of the file; invalidates the entry on change.
+    size : int
+        The size of the file; invalidates the entry on change.
+    cwd : str
+        The working directory that relative paths are resolved against.
+
+    Returns
+    -------
+    _T
+    """
+    handlers = {
+        PersistenceMode.json: _read_json,
+        PersistenceMode.yaml: _read_yaml,
+    }
+    return handlers[mode](path, klass)
+
+
 def deserialize(
     path: Path | str,
     klass: type[_DT],
@@ -161,25 +214,30 @@ def deserialize(
     if isinstance(path, str):
         path = Path(path)
 
-    if not path.exists():
+    # a single `stat` both confirms the file exists and provides the cache key
+    try:
+        stat = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
         msg = f"No file found at path `{path}` to deserialize to `{klass.__name__}`"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from None
 
     if mode == PersistenceMode.auto:
         mode = _mode_detect(path)
 
-    handlers = {
-        PersistenceMode.json: _read_json,
-        PersistenceMode.yaml: _read_yaml,
-    }
-
-    model = handlers[mode](path, klass)
+    # the cache is keyed on the file's metadata so edits are always re-read;
+    # the working directory is included because relative paths are resolved
+    # during validation.
+    cwd = os.getcwd()
+    model = _read_cached(
+        Path(cwd, path), klass, mode, stat.st_mtime_ns, stat.st_size, cwd
+    )
 
     if model is None:
         msg = f"Unable to deserialize a `{klass.__name__}` at `{path}` as `{mode}` from: \n{path.read_text()}"
         raise ValueError(msg)
 
-    return model
+    # callers may mutate the result; never hand out the cached instance
+    return model.model_copy(deep=True)
 
 
 def serialize(
@@ -218,7 +276,4 @@ def serialize(
     content = handlers[mode](model)
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open(mode="w") as fp:
-        nbytes = fp.write(content)
-
-    return nbytes
+    return path.write_text(content)
@@ -1,3 +1,4 @@
+import functools
 import itertools
 import os
 import typing as t
@@ -144,13 +145,60 @@ SLICE_FUNCTIONS = defaultdict(
 )
 
 
+def _clamp_slices(
+    time_slices: t.Iterable[tuple[datetime, datetime]],
+    start_date: datetime,
+    end_date: datetime,
+) -> t.Iterator[tuple[datetime, datetime]]:
+    """Clamp the first and last time slices to the requested date range.
+
+    Slices are passed through as they are produced; only the final slice is
+    held back so the end date can be applied to it.
+
+    Parameters
+    ----------
+    time_slices : Iterable[tuple[datetime, datetime]]
+        The period-aligned time slices.
+    start_date : datetime
+        The start date.
+    end_date : datetime
+        The end date.
+
+    Returns
+    -------
+    Iterator[tuple[datetime, datetime]]
+        Iterator over 2-tuples of (start_date, end_date).
+    """
+    slices = iter(time_slices)
+    if (current := next(slices, None)) is None:
+        return
+
+    # adjust when the start date is not the first day of the period
+    if start_date > current[0]:
+        current = (start_date, current[1])
+
+    for time_slice in slices:
+        yield current
+        current = time_slice
+
+    # adjust when the end date is not the last day of the period
+    if end_date < current[1]:
+        current = (current[0], end_date)
+
+    yield current
+
+
+@functools.lru_cache(maxsize=1024)
 def get_time_slices(
     start_date: datetime,
     end_date: datetime,
     frequency: str = SplitFrequency.Monthly.value,
-) -> t.Iterable[tuple[datetime, datetime]]:
+) -> tuple[tuple[datetime, datetime], ...]:
     """Get the time slices for the given start and end dates.
 
+    Results are memoized; the returned tuple is immutable so it may be
+    safely shared between callers.
+
     Parameters
     ----------
     start_date : datetime
@@ -162,21 +210,11 @@ def get_time_slices(
 
     Returns
     -------
-    Iterable[tuple[datetime, datetime]]
-        Iterable containing 2-tuples of (start_date, end_date).
+    tuple[tuple[datetime, datetime], ...]
+        Tuple containing 2-tuples of (start_date, end_date).
     """
     slice_fn = SLICE_FUNCTIONS[frequency]
-    time_slices = list(slice_fn(start_date, end_date))
-
-    # adjust when the start date is not the first day of the month
-    if start_date > time_slices[0][0]:
-        time_slices[0] = (start_date, time_slices[0][1])
-
-    # adjust when the end date is not the last day of the month
-    if end_date < time_slices[-1][1]:
-        time_slices[-1] = (time_slices[-1][0], end_date)
-
-    return time_slices
+    return tuple(_clamp_slices(slice_fn(start_date, end_date), start_date, end_date))
 
 
 class WorkplanTransformer(LoggingMixin):
@@ -346,7 +384,7 @@ class RomsMarblTimeSplitter(Transform):
         bp_path = step.fsm.work_dir / Path(step.blueprint_path).name
         serialize(bp_path, blueprint)
 
-        time_slices = list(get_time_slices(start_date, end_date, self.frequency))
+        time_slices = get_time_slices(start_date, end_date, self.frequency)
         n_slices = len(time_slices)
 
         if end_date <= start_date:
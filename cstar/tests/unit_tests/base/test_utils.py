@@ -7,6 +7,7 @@ from cstar.base.utils import (
     _get_sha256_hash,
     _list_to_concise_str,
     _replace_text_in_file,
+    deep_merge,
 )
 
 
@@ -266,3 +267,53 @@ class TestDictToTree:
             "        └── leaf6\n"
         )
         assert result == expected_output
+
+
+class TestDeepMerge:
+    """Tests for `deep_merge`, verifying nested values are merged in place."""
+
+    def test_nested_merge(self):
+        """Test `deep_merge` with nested dictionaries and lists of dictionaries.
+
+        Asserts
+        -------
+        - Ensures leaves are replaced, missing keys are added and untouched keys
+          are preserved at every level.
+        """
+        d1 = {
+            "a": 1,
+            "b": {"c": 2, "d": {"e": 3}},
+            "f": [{"g": 4, "h": 5}, {"g": 6}],
+        }
+        d2 = {"b": {"d": {"e": 30, "x": 7}}, "f": [{"g": 40}, {"i": 8}], "y": 9}
+
+        result = deep_merge(d1, d2)
+
+        assert result is d1
+        assert result == {
+            "a": 1,
+            "b": {"c": 2, "d": {"e": 30, "x": 7}},
+            "f": [{"g": 40, "h": 5}, {"g": 6, "i": 8}],
+            "y": 9,
+        }
+
+    def test_deeply_nested_merge(self):
+        """Test `deep_merge` with nesting deeper than the recursion limit.
+
+        Asserts
+        -------
+        - Ensures the merge completes without a `RecursionError`.
+        """
+        depth = 5000
+        d2: dict = {}
+        node = d2
+        for _ in range(depth):
+            node["x"] = {}
+            node = node["x"]
+        node["leaf"] = True
+
+        result = deep_merge({}, d2)
+
+        for _ in range(depth):
+            result = result["x"]
+        assert result == {"leaf": True}
@@ -3,7 +3,11 @@ from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
-from cstar.execution.scheduler_job import ExecutionStatus, SlurmJob
+from cstar.execution.scheduler_job import (
+    ExecutionStatus,
+    SlurmJob,
+    get_status_of_slurm_jobs,
+)
 from cstar.system.scheduler import SlurmPartition, SlurmQOS, SlurmScheduler
 
 
@@ -535,3 +539,54 @@ class TestSlurmJob:
             assert job.status == expected_status, (
                 f"Expected status '{expected_status}' but got '{job.status}'"
             )
+
+
+@patch("subprocess.run")
+def test_status_of_slurm_jobs_batched(mock_subprocess):
+    """Verifies that the status of several jobs is retrieved with one `sacct` call.
+
+    Mocks
+    -----
+    subprocess.run
+        Mocked to simulate the `sacct` command returning one row per job.
+
+    Asserts
+    -------
+    - That `sacct` is invoked once for all requested jobs.
+    - That each job is mapped to its status, including suffixed states.
+    - That failure-type states (e.g. `TIMEOUT`) are reported as `FAILED`.
+    - That jobs missing from the output are reported as `UNKNOWN`.
+    """
+    mock_subprocess.return_value = MagicMock(
+        returncode=0,
+        stdout=(
+            "101|RUNNING\n102|CANCELLED by 1234\n103|COMPLETED\n104|FAILED+\n"
+            "106|TIMEOUT\n107|OUT_OF_MEMORY\n108|COMPLETING\n"
+        ),
+        stderr="",
+    )
+
+    statuses = get_status_of_slurm_jobs(
+        ["101", "102", "103", "104", "105", "106", "107", "108"]
+    )
+
+    mock_subprocess.assert_called_once()
+    assert "-j 101,102,103,104,105,106,107,108" in mock_subprocess.call_args.args[0]
+    assert statuses == {
+        "101": ExecutionStatus.RUNNING,
+        "102": ExecutionStatus.CANCELLED,
+        "103": ExecutionStatus.COMPLETED,
+        "104": ExecutionStatus.FAILED,
+        "105": ExecutionStatus.UNKNOWN,
+        "106": ExecutionStatus.FAILED,
+        "107": ExecutionStatus.FAILED,
+        "108": ExecutionStatus.ENDING,
+    }
+
+
+def test_status_of_slurm_jobs_empty():
+    """Verifies that no `sacct` call is made when no jobs are requested."""
+    with patch("subprocess.run") as mock_subprocess:
+        assert get_status_of_slurm_jobs([]) == {}
+
+    mock_subprocess.assert_not_called()
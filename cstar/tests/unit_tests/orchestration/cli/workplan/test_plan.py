@@ -1,13 +1,73 @@
 from pathlib import Path
+from unittest import mock
 
 import pytest
+from typer.testing import CliRunner
 
-from cstar.cli.workplan.plan import render
+from cstar.cli.workplan.plan import (
+    CONTROL_NODES,
+    START_NODE,
+    TERMINAL_NODE,
+    RenderBackend,
+    app,
+    render,
+)
 from cstar.orchestration.models import Workplan
 from cstar.orchestration.orchestration import Planner
 from cstar.orchestration.serialization import deserialize
 
 
+@pytest.fixture
+def fanout_workplan_path(
+    tmp_path: Path,
+    wp_templates_dir: Path,
+    default_blueprint_path: str,
+) -> Path:
+    """Write the fanout workplan template to a temporary directory.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    wp_templates_dir: Path
+        Fixture returning the path to the directory containing workplan template files
+    default_blueprint_path : str
+        Fixture returning the default blueprint path contained in template workplans
+
+    Returns
+    -------
+    Path
+    """
+    template_path = wp_templates_dir / "fanout.yaml"
+
+    empty_bp_path = tmp_path / "blueprint.yaml"
+    empty_bp_path.touch()
+
+    content = template_path.read_text()
+    content = content.replace(default_blueprint_path, empty_bp_path.as_posix())
+
+    wp_path = tmp_path / template_path.name
+    wp_path.write_text(content)
+
+    return wp_path
+
+
+@pytest.fixture
+def fanout_planner(fanout_workplan_path: Path) -> Planner:
+    """Create a planner for the fanout workplan template.
+
+    Parameters
+    ----------
+    fanout_workplan_path : Path
+        The path to the fanout workplan
+
+    Returns
+    -------
+    Planner
+    """
+    return Planner(deserialize(fanout_workplan_path, Workplan))
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "workplan_name",
@@ -52,3 +112,167 @@ async def test_cli_plan_action(
     assert plan_path, "The render method failed to return a path"
     assert plan_path.exists(), "The render method failed to create the file"
     print(plan_path)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["png", "svg"])
+async def test_cli_plan_action_format(
+    tmp_path: Path,
+    fmt: str,
+    fanout_planner: Planner,
+) -> None:
+    """Verify that the requested image format is honored by the renderer.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    fmt : str
+        The image format to request
+    fanout_planner : Planner
+        A planner for the fanout workplan template
+    """
+    plan_path = await render(fanout_planner, tmp_path, fmt=fmt)  # type: ignore[arg-type]
+
+    assert plan_path.suffix == f".{fmt}"
+    assert plan_path.exists(), "The render method failed to create the file"
+
+
+@pytest.mark.asyncio
+async def test_cli_plan_action_graphviz_missing(
+    tmp_path: Path,
+    fanout_planner: Planner,
+) -> None:
+    """Verify that the graphviz backend reports a missing optional dependency.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    fanout_planner : Planner
+        A planner for the fanout workplan template
+    """
+    with (
+        mock.patch("networkx.nx_agraph.to_agraph", side_effect=ImportError),
+        pytest.raises(ValueError, match="pygraphviz"),
+    ):
+        await render(fanout_planner, tmp_path, backend=RenderBackend.GRAPHVIZ)
+
+    assert not list(tmp_path.glob("*.png"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("fmt", ["png", "svg"])
+async def test_cli_plan_action_graphviz(
+    tmp_path: Path,
+    fmt: str,
+    fanout_planner: Planner,
+) -> None:
+    """Verify that the graphviz backend styles every node and draws with `dot`.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    fmt : str
+        The image format to request
+    fanout_planner : Planner
+        A planner for the fanout workplan template
+    """
+    nodes: dict[str, mock.Mock] = {}
+    agraph = mock.MagicMock()
+    agraph.get_node.side_effect = lambda n: nodes.setdefault(n, mock.Mock(attr={}))
+
+    with mock.patch("networkx.nx_agraph.to_agraph", return_value=agraph):
+        plan_path = await render(
+            fanout_planner,
+            tmp_path,
+            fmt=fmt,  # type: ignore[arg-type]
+            backend=RenderBackend.GRAPHVIZ,
+        )
+
+    step_names = {step.name for step in fanout_planner.workplan.steps}
+    assert set(nodes) == step_names | CONTROL_NODES
+    assert nodes[START_NODE].attr == {"label": "start", "fillcolor": "#00ff00a1"}
+    assert nodes[TERMINAL_NODE].attr == {"label": "end", "fillcolor": "#ff7300a1"}
+    for name in step_names:
+        assert nodes[name].attr == {"label": name, "fillcolor": "#377aaaa1"}
+
+    assert plan_path.suffix == f".{fmt}"
+    agraph.layout.assert_called_once_with(prog="dot")
+    agraph.draw.assert_called_once_with(plan_path, format=fmt)
+
+
+def test_cli_plan_unknown_backend(tmp_path: Path) -> None:
+    """Verify that the plan command rejects an unknown rendering backend.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    """
+    wp_path = tmp_path / "workplan.yaml"
+    wp_path.touch()
+
+    result = CliRunner().invoke(
+        app, [wp_path.as_posix(), tmp_path.as_posix(), "--backend", "unknown"]
+    )
+
+    assert result.exit_code == 2
+    assert "unknown" in result.output
+
+
+@pytest.mark.asyncio
+async def test_cli_plan_action_unchanged(
+    tmp_path: Path,
+    fanout_planner: Planner,
+) -> None:
+    """Verify that re-rendering an unchanged plan reuses the existing image.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    fanout_planner : Planner
+        A planner for the fanout workplan template
+    """
+    plan_path = await render(fanout_planner, tmp_path)
+    first_mtime = plan_path.stat().st_mtime_ns
+
+    assert await render(fanout_planner, tmp_path) == plan_path
+    assert plan_path.stat().st_mtime_ns == first_mtime
+
+    # a change to the rendering options produces a new image
+    await render(fanout_planner, tmp_path, dpi=72)
+    assert plan_path.stat().st_mtime_ns != first_mtime
+
+
+def test_cli_plan_without_output_dir(
+    tmp_path: Path,
+    fanout_workplan_path: Path,
+) -> None:
+    """Verify that the plan command prints the execution order and renders no
+    image when no output directory is supplied.
+
+    Parameters
+    ----------
+    tmp_path : Path
+        Temporary directory for test outputs
+    fanout_workplan_path : Path
+        The path to the fanout workplan
+    """
+    with mock.patch("cstar.cli.workplan.plan.render") as mock_render:
+        result = CliRunner().invoke(app, [fanout_workplan_path.as_posix()])
+
+    assert result.exit_code == 0
+    mock_render.assert_not_called()
+
+    # steps are numbered in order and the fan-out follows its dependency
+    numbers, names = zip(
+        *(line.split(". ", 1) for line in result.output.strip().splitlines())
+    )
+    assert numbers == ("1", "2", "3", "4")
+    assert names[0] == "Step A"
+    assert set(names[1:]) == {"Step B_1", "Step B_2", "Step B_3"}
+
+    assert not [p for p in tmp_path.iterdir() if p.suffix in {".png", ".svg"}]
@@ -0,0 +1,62 @@
+import os
+from itertools import islice
+from unittest import mock
+
+import pytest
+
+from cstar.orchestration.dag_runner import incremental_delays, process_plan
+from cstar.orchestration.orchestration import Orchestrator, RunMode
+from cstar.orchestration.utils import ENV_CSTAR_ORCH_DELAYS
+
+
+@pytest.mark.parametrize(
+    ("custom_delays", "expected"),
+    [
+        pytest.param("", [0.1, 1, 2, 5, 15, 30, 60, 60, 60], id="defaults"),
+        pytest.param("1,2.5,4", [1, 2.5, 4, 4, 4, 4, 4, 4, 4], id="custom"),
+        pytest.param("1,x,4", [0.1, 1, 2, 5, 15, 30, 60, 60, 60], id="malformed"),
+    ],
+)
+def test_incremental_delays(custom_delays: str, expected: list[float]) -> None:
+    """Verify that the delay series settles on its final (longest) delay.
+
+    Parameters
+    ----------
+    custom_delays : str
+        The value of the delay environment variable
+    expected : list[float]
+        The expected leading values of the delay series
+    """
+    with mock.patch.dict(os.environ, {ENV_CSTAR_ORCH_DELAYS: custom_delays}):
+        delays = list(islice(incremental_delays(), len(expected)))
+
+    assert delays == expected
+
+
+@pytest.mark.asyncio
+async def test_process_plan_resets_delay() -> None:
+    """Verify that polling backs off while the plan is unchanged, resets when
+    the open set changes, and jitters each delay within its bounds.
+    """
+    open_sets = [{"a", "b"}, {"a", "b"}, {"a", "b"}, {"b"}, {"b"}, None]
+    closed_sets = [set(), set(), set(), {"a"}, {"a"}, {"a", "b"}]
+
+    orchestrator = mock.Mock(spec=Orchestrator)
+    orchestrator.get_open_nodes.side_effect = open_sets
+    orchestrator.get_closed_nodes.side_effect = closed_sets
+    mock_sleep = mock.AsyncMock()
+
+    with (
+        mock.patch.dict(os.environ, {ENV_CSTAR_ORCH_DELAYS: "1,2,4"}),
+        mock.patch("cstar.orchestration.dag_runner.asyncio.sleep", mock_sleep),
+    ):
+        await process_plan(orchestrator, RunMode.Monitor)
+
+    # unchanged, unchanged, changed (reset), unchanged, complete (no sleep)
+    expected_delays = [1, 2, 1, 2]
+
+    assert orchestrator.run.await_count == len(open_sets) - 1
+    assert mock_sleep.await_count == len(expected_delays)
+    for call, delay in zip(mock_sleep.await_args_list, expected_delays):
+        (duration,) = call.args
+        assert delay / 2 <= duration <= delay
@@ -0,0 +1,189 @@
+import asyncio
+import datetime
+import subprocess
+from multiprocessing import Process as MpProcess
+from pathlib import Path
+
+import pytest
+
+from cstar.orchestration.launch.local import LocalHandle, LocalLauncher, run_as_process
+from cstar.orchestration.models import Step
+from cstar.orchestration.orchestration import LiveStep, Status, Task
+
+
+@pytest.fixture
+def sleep_step(fake_blueprint_path: Path) -> Step:
+    """Create a step that is executed by the local launcher.
+
+    Parameters
+    ----------
+    fake_blueprint_path : Path
+        Fixture returning the path to an empty blueprint file
+
+    Returns
+    -------
+    Step
+    """
+    return Step(
+        name="local-step",
+        application="sleep",
+        blueprint=fake_blueprint_path.as_posix(),
+    )
+
+
+def _start(step: Step, cmd: list[str]) -> LocalHandle:
+    """Run a command in a local process the same way the launcher does.
+
+    Parameters
+    ----------
+    step : Step
+        The step that owns the process
+    cmd : list[str]
+        The command to execute
+
+    Returns
+    -------
+    LocalHandle
+        A handle to the newly started process
+    """
+    process = MpProcess(target=run_as_process, args=(step, cmd), daemon=True)
+    process.start()
+
+    return LocalHandle(
+        step,
+        process,
+        pid=process.pid or 0,
+        start_at=datetime.datetime.now(tz=datetime.timezone.utc),
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cmd",
+    [
+        ["sleep", "0.3"],
+        ["sh", "-c", "exit 3"],
+    ],
+)
+async def test_wait_exit_populates_exitcode(sleep_step: Step, cmd: list[str]) -> None:
+    """Verify that the exit code is available as soon as `wait_exit` returns.
+
+    Parameters
+    ----------
+    sleep_step : Step
+        A step executed by the local launcher
+    cmd : list[str]
+        The command to execute
+    """
+    handle = _start(sleep_step, cmd)
+
+    await handle.wait_exit()
+
+    assert handle.process.exitcode is not None
+    assert await LocalLauncher.query_status(sleep_step, handle) != Status.Running
+
+
+def _is_alive(pid: int) -> bool:
+    """Determine if a process is running (a zombie is not considered running).
+
+    Parameters
+    ----------
+    pid : int
+        The process ID
+
+    Returns
+    -------
+    bool
+    """
+    result = subprocess.run(
+        ["ps", "-o", "stat=", "-p", str(pid)],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    state = result.stdout.strip()
+    return bool(state) and not state.startswith("Z")
+
+
+async def _read_pid(path: Path) -> int:
+    """Wait for a process ID to be written to a file.
+
+    Parameters
+    ----------
+    path : Path
+        The file the process ID is written to
+
+    Returns
+    -------
+    int
+    """
+    for _ in range(100):
+        if path.exists() and (content := path.read_text().strip()):
+            return int(content)
+        await asyncio.sleep(0.05)
+
+    msg = f"No process ID was written to `{path}`"
+    raise TimeoutError(msg)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "preamble",
+    [
+        pytest.param("", id="terminates"),
+        pytest.param("trap '' TERM; ", id="ignores-term"),
+    ],
+)
+async def test_cancel_signals_process_group(
+    sleep_step: Step,
+    tmp_path: Path,
+    preamble: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Verify that cancelling a local task stops every process in its group,
+    escalating to SIGKILL when a process ignores SIGTERM.
+
+    Parameters
+    ----------
+    sleep_step : Step
+        A step executed by the local launcher
+    tmp_path : Path
+        Temporary directory for test outputs
+    preamble : str
+        Shell commands executed before the grandchild process is started
+    monkeypatch : pytest.MonkeyPatch
+        Used to shorten the termination grace period
+    """
+    monkeypatch.setattr(LocalLauncher, "TERMINATE_GRACE", 0.5)
+
+    pid_path = tmp_path / "grandchild.pid"
+    script = f"{preamble}sleep 30 & echo $! > {pid_path}; wait"
+    handle = _start(sleep_step, ["sh", "-c", script])
+    task = Task(step=LiveStep.from_step(sleep_step), handle=handle)
+
+    grandchild_pid = await _read_pid(pid_path)
+    assert _is_alive(grandchild_pid)
+
+    cancelled = await LocalLauncher.cancel(task)
+
+    assert cancelled.status == Status.Cancelled
+    assert handle.process.exitcode is not None
+    assert not _is_alive(grandchild_pid)
+
+
+@pytest.mark.asyncio
+async def test_cancel_completed_process(sleep_step: Step) -> None:
+    """Verify that cancelling a completed local task leaves its status unchanged.
+
+    Parameters
+    ----------
+    sleep_step : Step
+        A step executed by the local launcher
+    """
+    handle = _start(sleep_step, ["true"])
+    task = Task(step=LiveStep.from_step(sleep_step), handle=handle, status=Status.Done)
+
+    await handle.wait_exit()
+    cancelled = await LocalLauncher.cancel(task)
+
+    assert cancelled.status == Status.Done
@@ -11,6 +11,7 @@ import pytest
 from cstar.base.env import ENV_CSTAR_RUNID, FLAG_ON
 from cstar.base.feature import ENV_FF_ORCH_TRX_TIMESPLIT
 from cstar.orchestration.launch.local import LocalLauncher
+from cstar.orchestration.launch.slurm import SlurmHandle, SlurmLauncher
 from cstar.orchestration.models import Application, RomsMarblBlueprint, Step, Workplan
 from cstar.orchestration.orchestration import (
     KEY_STATUS,
@@ -350,3 +351,33 @@ def test_workplan_transformation(diamond_workplan: Workplan) -> None:
         step_ed = blueprint.runtime_params.end_date
 
         assert ((step_sd, step_ed)) in get_time_slices(sd, ed)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("sacct_state", "expected"),
+    [
+        ("TIMEOUT", Status.Failed),
+        ("OUT_OF_MEMORY", Status.Failed),
+        ("NODE_FAIL", Status.Failed),
+        ("COMPLETED", Status.Done),
+    ],
+)
+async def test_slurm_launcher_terminal_states(
+    tmp_path: Path, sacct_state: str, expected: Status
+) -> None:
+    """Verify that SLURM jobs ending in failure-type states are reported as
+    terminal so the orchestrator stops polling them.
+    """
+    bp_path = tmp_path / "blueprint.yaml"
+    bp_path.touch()
+
+    step = Step(name="s-00", application="sleep", blueprint=bp_path.as_posix())
+
+    with mock.patch("subprocess.run") as mock_run:
+        mock_run.return_value = mock.MagicMock(
+            returncode=0, stdout=f"123|{sacct_state}\n", stderr=""
+        )
+        status = await SlurmLauncher.query_status(step, SlurmHandle(job_id="123"))
+
+    assert status == expected
@@ -6,7 +6,7 @@ from pathlib import Path
 import pytest
 
 from cstar.orchestration.models import Step, Workplan
-from cstar.orchestration.orchestration import Planner
+from cstar.orchestration.orchestration import KEY_STATUS, Planner, Status
 from cstar.orchestration.serialization import deserialize
 
 
@@ -209,3 +209,54 @@ def test_planner_bfs_breaker(
         assert from_idx < to_idx, (
             f"Dependency between {n_from} and {n_to} was not honored"
         )
+
+
+def test_planner_flatten_is_cached(
+    gen_fake_steps: t.Callable[[int], t.Generator[Step, None, None]],
+) -> None:
+    """Verify that repeated calls to flatten reuse the computed traversal.
+
+    Parameters
+    ----------
+    gen_fake_steps : t.Callable[[int], t.Generator[Step, None, None]]
+        A generator function to produce minimally valid test steps
+    """
+    steps = list(gen_fake_steps(3))
+    steps[1].depends_on.append(steps[0].name)
+    steps[2].depends_on.append(steps[1].name)
+
+    plan = Workplan(name="test-plan", description="test-description", steps=steps)
+    planner = Planner(plan)
+
+    first = list(planner.flatten())
+    first.clear()  # mutating a returned plan must not corrupt the cache
+    second = list(planner.flatten())
+
+    assert [s.name for s in second] == [s.name for s in steps]
+
+
+def test_planner_status_index(
+    gen_fake_steps: t.Callable[[int], t.Generator[Step, None, None]],
+) -> None:
+    """Verify that stored statuses are reflected by status lookups.
+
+    Parameters
+    ----------
+    gen_fake_steps : t.Callable[[int], t.Generator[Step, None, None]]
+        A generator function to produce minimally valid test steps
+    """
+    steps = list(gen_fake_steps(3))
+    plan = Workplan(name="test-plan", description="test-description", steps=steps)
+    planner = Planner(plan)
+
+    all_names = {s.name for s in steps}
+    assert planner.nodes_with_status([Status.Unsubmitted]) == all_names
+
+    planner.store(steps[0].name, KEY_STATUS, Status.Running)
+    planner.store(steps[0].name, KEY_STATUS, Status.Done)
+
+    assert planner.nodes_with_status([Status.Done]) == {steps[0].name}
+    assert not planner.nodes_with_status([Status.Running])
+    assert planner.nodes_with_status([Status.Unsubmitted]) == all_names - {
+        steps[0].name
+    }
@@ -1,3 +1,4 @@
+import json
 import typing as t
 import uuid
 from pathlib import Path
@@ -190,3 +191,43 @@ def test_workplan_runtime_vars(
     expected = set(expected_vars)
 
     assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        json.dumps(
+            {
+                "name": "wp",
+                "description": "desc",
+                "steps": [{"name": "s", "application": "sleep", "blueprint": "bp"}],
+            }
+        ),
+        "{name: wp, description: desc, steps: [{name: s, application: sleep, blueprint: bp}]}",
+    ],
+)
+def test_workplan_flow_style_yaml(tmp_path: Path, content: str) -> None:
+    """Verify that YAML files holding JSON or flow-style documents are parsed."""
+    yaml_path = tmp_path / "workplan.yaml"
+    yaml_path.write_text(content)
+
+    workplan = deserialize(yaml_path, Workplan)
+
+    assert workplan.name == "wp"
+    assert workplan.steps[0].application == Application.SLEEP
+
+
+def test_deserialize_cached_copy(tmp_path: Path) -> None:
+    """Verify repeated loads are independent and reflect changes to the file."""
+    content = "{name: %s, description: desc, steps: [{name: s, application: sleep, blueprint: bp}]}"
+    yaml_path = tmp_path / "workplan.yaml"
+    yaml_path.write_text(content % "wp-1")
+
+    first = deserialize(yaml_path, Workplan)
+    first.name = "mutated"
+
+    assert deserialize(yaml_path, Workplan).name == "wp-1"
+
+    yaml_path.write_text(content % "wp-22")
+
+    assert deserialize(yaml_path, Workplan).name == "wp-22"
@@ -80,6 +80,19 @@ def test_time_splitting() -> None:
         assert curr_start == datetime(curr_end.year, curr_end.month - 1, 1)
 
 
+def test_time_splitting_memoized() -> None:
+    """Verify that repeated time splits reuse the immutable result."""
+    start_date = datetime(2025, 1, 15)
+    end_date = datetime(2025, 6, 15)
+
+    time_slices = get_time_slices(start_date, end_date)
+
+    assert isinstance(time_slices, tuple)
+    assert get_time_slices(start_date, end_date) is time_slices
+    assert time_slices[0] == (start_date, datetime(2025, 2, 1))
+    assert time_slices[-1][1] == end_date
+
+
 @pytest.mark.parametrize(
     ("application", "transform_fn"),
     [